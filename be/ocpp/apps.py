@@ -6,7 +6,6 @@ class OcppConfig(AppConfig):
     name = "ocpp"
 
     def ready(self):
-        super().ready()
         from ocpp.utils.settings import load_ocpp_middleware
 
         load_ocpp_middleware()
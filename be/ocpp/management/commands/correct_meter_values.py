@@ -1,17 +1,23 @@
-import csv
 import datetime
 import logging
-import sys
+from itertools import groupby
+from operator import attrgetter
+from zoneinfo import ZoneInfo
 
-import pytz
 from django.core.management.base import BaseCommand
-from ocpp.models import Transaction
+from django.db import transaction as db_transaction
+from django.db.models import F, Window
+from django.db.models.functions import Lag
+from ocpp.models import MeterValue, Transaction
+from ocpp.utils.report import stdout_csv_writer
 
 logger = logging.getLogger(__name__)
 logging.basicConfig(level=logging.INFO)
 
 ENERGY_MAX_JUMP = 10000
 DATETIME_FORMAT = "%Y-%m-%d %H:%M:%S"
+ITERATOR_CHUNK_SIZE = 2000
+BULK_UPDATE_BATCH_SIZE = 1000
 
 
 class Command(BaseCommand):
@@ -20,17 +26,47 @@ class Command(BaseCommand):
     def add_arguments(self, parser):
         parser.add_argument("start", type=datetime.datetime.fromisoformat)
         parser.add_argument("end", type=datetime.datetime.fromisoformat)
-        parser.add_argument("--tz", type=str, default="America/Vancouver")
+        parser.add_argument("--tz", type=ZoneInfo, default="America/Vancouver")
         parser.add_argument("--dry-run", action="store_true")
 
     def handle(self, *args, **options):
-        csv_writer = csv.writer(sys.stdout)
-        tz = pytz.timezone(options["tz"])
-        options["start"] = tz.localize(options["start"])
-        options["end"] = tz.localize(options["end"])
-        transactions = Transaction.objects.filter(
-            stopped_at__gte=options["start"], stopped_at__lt=options["end"]
-        ).order_by("started_at")
+        with stdout_csv_writer() as csv_writer:
+            self.correct_meter_values(csv_writer, **options)
+
+    def correct_meter_values(self, csv_writer, **options):
+        tz = options["tz"]
+        options["start"] = options["start"].replace(tzinfo=tz)
+        options["end"] = options["end"].replace(tzinfo=tz)
+        # jumps are found by the database, only the offending readings are fetched
+        energy_jumps = (
+            MeterValue.objects.filter(
+                measurand="Energy.Active.Import.Register",
+                transaction__stopped_at__gte=options["start"],
+                transaction__stopped_at__lt=options["end"],
+            )
+            .annotate(
+                prev_value=Window(
+                    Lag("value"),
+                    partition_by=F("transaction_id"),
+                    order_by=F("timestamp").asc(),
+                )
+            )
+            .annotate(delta_value=F("value") - F("prev_value"))
+            # a reading following a zero one is not counted as a jump
+            .filter(delta_value__gt=ENERGY_MAX_JUMP)
+            .exclude(prev_value=0)
+            .select_related("transaction__charge_point")
+            .only(
+                "id",
+                "timestamp",
+                "value",
+                "transaction__id",
+                "transaction__meter_stop",
+                "transaction__charge_point__id",
+                "transaction__charge_point__name",
+            )
+            .order_by("transaction__started_at", "transaction_id", "timestamp")
+        )
         csv_writer.writerow(
             [
                 "timestamp",
@@ -44,36 +80,47 @@ class Command(BaseCommand):
                 "transaction.meter_correction",
             ]
         )
-        for transaction in transactions:
+        # corrections are written in batches rather than one UPDATE per row
+        incorrect_meter_values = []
+        corrected_transactions = []
+
+        def write_corrections():
+            if not options["dry_run"]:
+                with db_transaction.atomic():
+                    MeterValue.objects.bulk_update(
+                        incorrect_meter_values,
+                        ["is_incorrect"],
+                        batch_size=BULK_UPDATE_BATCH_SIZE,
+                    )
+                    Transaction.objects.bulk_update(
+                        corrected_transactions,
+                        ["meter_correction"],
+                        batch_size=BULK_UPDATE_BATCH_SIZE,
+                    )
+            incorrect_meter_values.clear()
+            corrected_transactions.clear()
+
+        for transaction, jumps in groupby(
+            energy_jumps.iterator(chunk_size=ITERATOR_CHUNK_SIZE),
+            key=attrgetter("transaction"),
+        ):
             meter_correction = 0
             report_rows = []
-            prev = None
-            for cur in transaction.metervalue_set.filter(
-                measurand="Energy.Active.Import.Register"
-            ).order_by("timestamp"):
-                if (
-                    prev
-                    and prev.value
-                    and cur.value
-                    and cur.value - prev.value > ENERGY_MAX_JUMP
-                ):
-                    delta_value = cur.value - prev.value
-                    report_rows.append(
-                        [
-                            cur.timestamp.astimezone(tz).strftime(DATETIME_FORMAT),
-                            transaction.charge_point,
-                            transaction.id,
-                            cur.id,
-                            round(prev.value, 2),
-                            round(cur.value, 2),
-                            round(delta_value, 2),
-                        ]
-                    )
-                    cur.is_incorrect = True
-                    if not options["dry_run"]:
-                        cur.save(update_fields=["is_incorrect"])
-                    meter_correction += delta_value
-                prev = cur
+            for cur in jumps:
+                report_rows.append(
+                    [
+                        cur.timestamp.astimezone(tz).strftime(DATETIME_FORMAT),
+                        transaction.charge_point,
+                        transaction.id,
+                        cur.id,
+                        round(cur.prev_value, 2),
+                        round(cur.value, 2),
+                        round(cur.delta_value, 2),
+                    ]
+                )
+                cur.is_incorrect = True
+                incorrect_meter_values.append(cur)
+                meter_correction += cur.delta_value
             if meter_correction:
                 transaction.meter_correction = -meter_correction
                 for row in report_rows:
@@ -82,5 +129,7 @@ class Command(BaseCommand):
                         round(transaction.meter_correction, 2),
                     ]
                     csv_writer.writerow(row)
-                if not options["dry_run"]:
-                    transaction.save(update_fields=["meter_correction"])
+                corrected_transactions.append(transaction)
+                if len(incorrect_meter_values) >= BULK_UPDATE_BATCH_SIZE:
+                    write_corrections()
+        write_corrections()
@@ -1,16 +1,44 @@
-import csv
 import datetime
 import logging
-import sys
+from zoneinfo import ZoneInfo
 
-import pytz
 from django.core.management.base import BaseCommand
 from ocpp.models import Transaction
+from ocpp.utils.report import stdout_csv_writer
 
 logger = logging.getLogger(__name__)
 logging.basicConfig(level=logging.INFO)
 
 DATETIME_FORMAT = "%Y-%m-%d %H:%M:%S"
+ITERATOR_CHUNK_SIZE = 2000
+
+
+def transaction_report_rows(start, end, tz):
+    """Rows of the transaction report, header first, produced as they are fetched"""
+    yield [
+        "id",
+        "charge_point",
+        "started_at",
+        "stopped_at",
+        "meter",
+        "meter_correction",
+        "stop_reason",
+    ]
+    transactions = (
+        Transaction.objects.filter(stopped_at__gte=start, stopped_at__lt=end)
+        .select_related("charge_point")
+        .order_by("started_at")
+    )
+    for tx in transactions.iterator(chunk_size=ITERATOR_CHUNK_SIZE):
+        yield [
+            tx.id,
+            tx.charge_point,
+            tx.started_at.astimezone(tz).strftime(DATETIME_FORMAT),
+            tx.stopped_at.astimezone(tz).strftime(DATETIME_FORMAT),
+            tx.meter_stop,
+            tx.meter_correction,
+            tx.stop_reason,
+        ]
 
 
 class Command(BaseCommand):
@@ -18,39 +46,16 @@ class Command(BaseCommand):
         parser.add_argument("report_type", type=str)
         parser.add_argument("start", type=datetime.datetime.fromisoformat)
         parser.add_argument("end", type=datetime.datetime.fromisoformat)
-        parser.add_argument("--tz", type=str, default="America/Vancouver")
+        parser.add_argument("--tz", type=ZoneInfo, default="America/Vancouver")
 
     def handle(self, *args, **options):
-        tz = pytz.timezone(options["tz"])
-        options["start"] = tz.localize(options["start"])
-        options["end"] = tz.localize(options["end"])
+        tz = options["tz"]
+        options["start"] = options["start"].replace(tzinfo=tz)
+        options["end"] = options["end"].replace(tzinfo=tz)
         if options["report_type"] == "transaction":
-            transactions = Transaction.objects.filter(
-                stopped_at__gte=options["start"], stopped_at__lt=options["end"]
-            ).order_by("started_at")
-            writer = csv.writer(sys.stdout)
-            writer.writerow(
-                [
-                    "id",
-                    "charge_point",
-                    "started_at",
-                    "stopped_at",
-                    "meter",
-                    "meter_correction",
-                    "stop_reason",
-                ]
-            )
-            for tx in transactions:
-                writer.writerow(
-                    [
-                        tx.id,
-                        tx.charge_point,
-                        tx.started_at.astimezone(tz).strftime(DATETIME_FORMAT),
-                        tx.stopped_at.astimezone(tz).strftime(DATETIME_FORMAT),
-                        tx.meter_stop,
-                        tx.meter_correction,
-                        tx.stop_reason,
-                    ]
+            with stdout_csv_writer() as writer:
+                writer.writerows(
+                    transaction_report_rows(options["start"], options["end"], tz)
                 )
         elif options["report_type"] == "message":
             pass
@@ -0,0 +1,33 @@
+# Generated by Django 5.2.18 on 2026-10-16 19:59
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("ocpp", "0007_metervalue_is_incorrect_transaction_meter_correction"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="message",
+            index=models.Index(
+                fields=["charge_point", "created_at"],
+                name="ocpp_messag_charge__fda8ba_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="metervalue",
+            index=models.Index(
+                fields=["transaction", "timestamp"],
+                name="ocpp_meterv_transac_ee96ff_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="websocketevent",
+            index=models.Index(
+                fields=["charge_point", "type", "timestamp"],
+                name="ocpp_websoc_charge__a060d3_idx",
+            ),
+        ),
+    ]
@@ -0,0 +1,24 @@
+# Generated by Django 5.2.18 on 2026-10-16 20:02
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("ocpp", "0008_message_ocpp_messag_charge__fda8ba_idx_and_more"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="message",
+            name="reply",
+            field=models.ForeignKey(
+                blank=True,
+                null=True,
+                on_delete=django.db.models.deletion.SET_NULL,
+                related_name="+",
+                to="ocpp.message",
+            ),
+        ),
+    ]
@@ -0,0 +1,19 @@
+# Generated by Django 5.2.18 on 2026-10-16 20:07
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("ocpp", "0009_alter_message_reply"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="metervalue",
+            index=models.Index(
+                fields=["transaction", "measurand", "timestamp"],
+                name="ocpp_meterv_transac_ebdfbd_idx",
+            ),
+        ),
+    ]
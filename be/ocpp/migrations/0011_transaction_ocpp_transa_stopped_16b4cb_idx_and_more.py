@@ -0,0 +1,24 @@
+# Generated by Django 5.2.18 on 2026-10-16 20:07
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("ocpp", "0010_metervalue_ocpp_meterv_transac_ebdfbd_idx"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="transaction",
+            index=models.Index(
+                fields=["stopped_at"], name="ocpp_transa_stopped_16b4cb_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="transaction",
+            index=models.Index(
+                fields=["started_at"], name="ocpp_transa_started_f61837_idx"
+            ),
+        ),
+    ]
@@ -0,0 +1,19 @@
+# Generated by Django 5.2.18 on 2026-10-16 20:14
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("ocpp", "0011_transaction_ocpp_transa_stopped_16b4cb_idx_and_more"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="message",
+            index=models.Index(
+                fields=["unique_id", "message_type"],
+                name="ocpp_messag_unique__097907_idx",
+            ),
+        ),
+    ]
@@ -32,3 +32,9 @@ class ChargePoint(Timestamped):
 
     def __str__(self):
         return "{} / {}".format(self.id, self.name)
+
+    def update(self, **fields):
+        """Set the given fields on this instance and persist them with a single UPDATE"""
+        for name, value in fields.items():
+            setattr(self, name, value)
+        ChargePoint.objects.filter(pk=self.pk).update(**fields)
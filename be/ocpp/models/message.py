@@ -6,8 +6,13 @@ from ocpp.types.actor_type import ActorType
 from ocpp.types.action import Action
 from ocpp.types.error_code import ErrorCode
 from ocpp.types.message_type import MessageType
+from ocpp.utils.model.model_enum import MemberLookup
 from ocpp.utils.model.timestamped import Timestamped
 
+MESSAGE_TYPES = MemberLookup(MessageType)
+ACTIONS = MemberLookup(Action)
+ERROR_CODES = MemberLookup(ErrorCode)
+
 
 class Message(Timestamped):
     charge_point = models.ForeignKey(ChargePoint, null=True, on_delete=models.CASCADE)
@@ -23,36 +28,51 @@ class Message(Timestamped):
     )
     error_description = models.CharField(max_length=255, null=True, blank=True)
     data = models.JSONField()
-    reply = models.ForeignKey("ocpp.Message", null=True, on_delete=models.SET_NULL)
+    reply = models.ForeignKey(
+        "ocpp.Message",
+        null=True,
+        blank=True,
+        on_delete=models.SET_NULL,
+        related_name="+",
+    )
 
     class Meta:
         unique_together = ("actor", "unique_id")
+        indexes = [
+            models.Index(fields=["charge_point", "created_at"]),
+            models.Index(fields=["unique_id", "message_type"]),
+        ]
 
     def transaction_from_data(self):
-        transaction = Transaction.objects.get(id=self.data["transactionId"])
-        if not self.transaction:
+        transaction_id = self.data["transactionId"]
+        if self.transaction_id == transaction_id:
+            return self.transaction
+        transaction = Transaction.objects.select_related("charge_point").get(
+            id=transaction_id
+        )
+        if not self.transaction_id:
+            # persisted along with the reply by the call handler
             self.transaction = transaction
-            self.save(update_fields=["transaction"])
         return transaction
 
     def to_ocpp(self):
-        message_type = MessageType(self.message_type)
+        message_type = MESSAGE_TYPES[self.message_type]
         if message_type == MessageType.call:
             ocpp_message = [
-                int(self.message_type),
+                message_type.value,
                 self.unique_id,
                 str(self.action),
                 self.data,
             ]
         elif message_type == MessageType.call_result:
             ocpp_message = [
-                int(self.message_type),
+                message_type.value,
                 self.unique_id,
                 self.data,
             ]
         elif message_type == MessageType.call_error:
             ocpp_message = [
-                int(self.message_type),
+                message_type.value,
                 self.unique_id,
                 str(self.error_code),
                 self.error_description or "",
@@ -61,13 +81,15 @@ class Message(Timestamped):
         else:
             raise ValueError("Unknown message type {}".format(self.message_type))
 
-        return dict(
-            id=self.charge_point.id, actor=str(self.actor), message=ocpp_message
-        )
+        return {
+            "id": self.charge_point_id,
+            "actor": str(self.actor),
+            "message": ocpp_message,
+        }
 
     @staticmethod
     def from_occp(charge_point: ChargePoint, ocpp_message: dict):
-        message_type = MessageType(ocpp_message["message"][0])
+        message_type = MESSAGE_TYPES[ocpp_message["message"][0]]
 
         action = None
         error_code = None
@@ -88,8 +110,8 @@ class Message(Timestamped):
             message_type=message_type,
             unique_id=unique_id,
             actor=ActorType.charge_point,
-            action=Action(action) if action else None,
-            error_code=ErrorCode(error_code) if error_code else None,
+            action=ACTIONS[action] if action else None,
+            error_code=ERROR_CODES[error_code] if error_code else None,
             error_description=error_description,
             data=rest[0] if rest else None,
         )
@@ -1,7 +1,10 @@
-import dateutil.parser
+from datetime import datetime
+
 from django.db import models
 from ocpp.models.transaction import Transaction
 
+BULK_CREATE_BATCH_SIZE = 100
+
 
 class MeterValue(models.Model):
     timestamp = models.DateTimeField()
@@ -16,19 +19,44 @@ class MeterValue(models.Model):
     is_final = models.BooleanField(default=False)
     is_incorrect = models.BooleanField(default=False)
 
+    class Meta:
+        indexes = [
+            models.Index(fields=["transaction", "timestamp"]),
+            models.Index(fields=["transaction", "measurand", "timestamp"]),
+        ]
+
+    @staticmethod
+    def build_from_json(transaction: Transaction, meter_value: dict, is_final=False):
+        """Build unsaved MeterValues for every sampled value of an OCPP MeterValue"""
+        timestamp = datetime.fromisoformat(meter_value["timestamp"])
+        return [
+            MeterValue(
+                timestamp=timestamp,
+                transaction=transaction,
+                value=sample.get("value"),
+                measurand=sample.get("measurand") or "Energy.Active.Import.Register",
+                unit=sample.get("unit") or "Wh",
+                context=sample.get("context") or "Sample.Periodic",
+                format=sample.get("format") or "Raw",
+                location=sample.get("location") or "Outlet",
+                phase=sample.get("phase") or "",
+                is_final=is_final,
+            )
+            for sample in meter_value["sampledValue"]
+        ]
+
     @staticmethod
-    def create_from_json(
-        transaction: Transaction, timestamp: str, sample: dict, is_final=False
+    def bulk_create_from_json(
+        transaction: Transaction, meter_values: list, is_final=False
     ):
-        return MeterValue.objects.create(
-            timestamp=dateutil.parser.isoparse(timestamp),
-            transaction=transaction,
-            value=sample.get("value"),
-            measurand=sample.get("measurand") or "Energy.Active.Import.Register",
-            unit=sample.get("unit") or "Wh",
-            context=sample.get("context") or "Sample.Periodic",
-            format=sample.get("format") or "Raw",
-            location=sample.get("location") or "Outlet",
-            phase=sample.get("phase") or "",
-            is_final=is_final,
+        """Insert the sampled values of a list of OCPP MeterValues in bulk"""
+        return MeterValue.objects.bulk_create(
+            [
+                value
+                for meter_value in meter_values
+                for value in MeterValue.build_from_json(
+                    transaction, meter_value, is_final=is_final
+                )
+            ],
+            batch_size=BULK_CREATE_BATCH_SIZE,
         )
@@ -17,11 +17,22 @@ class Transaction(models.Model):
         max_length=64, choices=StopReason.choices(), null=True, blank=True
     )
 
-    def stop(self, reason: StopReason, meter_stop: int):
+    class Meta:
+        indexes = [
+            models.Index(fields=["stopped_at"]),
+            models.Index(fields=["started_at"]),
+        ]
+
+    STOP_FIELDS = ["meter_stop", "stop_reason", "stopped_at"]
+
+    def mark_stopped(self, reason: StopReason, meter_stop: int, stopped_at):
+        """Set the stop fields without saving, for callers that persist in bulk"""
         self.meter_stop = meter_stop
         self.stop_reason = reason
-        self.stopped_at = utc_now()
-        self.save(update_fields=["meter_stop", "stop_reason", "stopped_at"])
-        charge_point = self.charge_point
-        charge_point.last_tx_stop_at = utc_now()
-        charge_point.save(update_fields=["last_tx_stop_at"])
+        self.stopped_at = stopped_at
+
+    def stop(self, reason: StopReason, meter_stop: int):
+        now = utc_now()
+        self.mark_stopped(reason, meter_stop, now)
+        self.save(update_fields=self.STOP_FIELDS)
+        self.charge_point.update(last_tx_stop_at=now)
@@ -8,3 +8,6 @@ class WebsocketEvent(models.Model):
     charge_point = models.ForeignKey(ChargePoint, null=True, on_delete=models.CASCADE)
     type = models.CharField(max_length=64, choices=WebsocketEventType.choices())
     timestamp = models.DateTimeField()
+
+    class Meta:
+        indexes = [models.Index(fields=["charge_point", "type", "timestamp"])]
@@ -1,23 +1,30 @@
+import atexit
+
 from django.db.models.signals import post_save
 from django.dispatch import receiver
-from fluent import sender
+from fluent import asyncsender
 
 from levity import settings
 from ocpp.models import WebsocketEvent, Message
 
 
+# ship records from a background thread so fluentd never stalls message handling
 logger = (
-    sender.FluentSender("ocpp", host=settings.FLUENTD_HOST, port=24224)
+    asyncsender.FluentSender(
+        "ocpp", host=settings.FLUENTD_HOST, port=24224, queue_circular=True
+    )
     if settings.FLUENTD_HOST
     else None
 )
+if logger:
+    atexit.register(logger.close)
 
 
 @receiver(post_save, sender=WebsocketEvent)
 def log_websocket_events(instance: WebsocketEvent, created, **kwargs):
     if not logger or not created:
         return
-    logger.emit(f"ws.{instance.type}", dict(id=instance.charge_point.id))
+    logger.emit(f"ws.{instance.type}", dict(id=instance.charge_point_id))
 
 
 @receiver(post_save, sender=Message)
@@ -7,6 +7,12 @@ from ocpp.types.action import Action
 from ocpp.types.actor_type import ActorType
 from ocpp.types.message_type import MessageType
 from ocpp.types.websocket_event_type import WebsocketEventType
+from ocpp.utils.model.model_enum import MemberLookup
+
+WEBSOCKET_EVENT_TYPES = MemberLookup(WebsocketEventType)
+MESSAGE_TYPES = MemberLookup(MessageType)
+ACTIONS = MemberLookup(Action)
+ACTOR_TYPES = MemberLookup(ActorType)
 
 WEBSOCKET_COUNTERS = {
     WebsocketEventType.disconnect: Counter(
@@ -19,8 +25,10 @@ WEBSOCKET_COUNTERS = {
 
 @receiver(post_save, sender=WebsocketEvent)
 def count_websocket_events(instance: WebsocketEvent, created, **kwargs):
-    event_type = WebsocketEventType(instance.type)
-    if created and event_type in WEBSOCKET_COUNTERS:
+    if not created:
+        return
+    event_type = WEBSOCKET_EVENT_TYPES[instance.type]
+    if event_type in WEBSOCKET_COUNTERS:
         WEBSOCKET_COUNTERS[event_type].labels(
             charge_point_id=instance.charge_point_id
         ).inc()
@@ -37,11 +45,13 @@ MESSAGE_COUNTERS = {
 
 @receiver(post_save, sender=Message)
 def count_messages(instance: Message, created, **kwargs):
-    action = Action(instance.action) if instance.action else None
+    if not created:
+        return
+    action = ACTIONS[instance.action] if instance.action else None
     k = (
-        ActorType(instance.actor),
-        MessageType(instance.message_type),
+        ACTOR_TYPES[instance.actor],
+        MESSAGE_TYPES[instance.message_type],
         action,
     )
-    if created and k in MESSAGE_COUNTERS:
+    if k in MESSAGE_COUNTERS:
         MESSAGE_COUNTERS[k].labels(charge_point_id=instance.charge_point_id).inc()
@@ -1,5 +1,9 @@
 import abc
-from functools import lru_cache
+
+from django.core.signals import setting_changed
+from django.db import transaction as db_transaction
+from django.db.models import Subquery
+from django.dispatch import receiver
 
 from ocpp.models.message import Message
 from ocpp.services.charge_point_service import ChargePointService
@@ -7,7 +11,7 @@ from ocpp.services.ocpp.anon.auto_remote_start import AutoRemoteStartMiddleware
 from ocpp.services.ocpp.automation.orphaned_transaction import (
     OrphanedTransactionMiddleware,
 )
-from ocpp.services.ocpp.base import ResponseMiddleware, OCPPRequest
+from ocpp.services.ocpp.base import ResponseMiddleware, OCPPRequest, is_passthrough
 from ocpp.services.ocpp.core.authorize import AuthorizeMiddleware
 from ocpp.services.ocpp.core.boot_notification import BootNotificationMiddleware
 from ocpp.services.ocpp.core.data_transfer import DataTransferMiddleware
@@ -25,9 +29,14 @@ from ocpp.services.ocpp.core.stop_transaction import StopTransactionMiddleware
 from ocpp.types.action import Action
 from ocpp.types.actor_type import ActorType
 from ocpp.types.message_type import MessageType
-from ocpp.utils.serialization import json_decode, json_encode
+from ocpp.utils.model.model_enum import MemberLookup
+from ocpp.utils.serialization import json_normalize
 from ocpp.utils.settings import load_ocpp_middleware
 
+ACTIONS = MemberLookup(Action)
+ACTOR_TYPES = MemberLookup(ActorType)
+MESSAGE_TYPES = MemberLookup(MessageType)
+
 DEFAULT_MIDDLEWARE_CONFIG = {
     (Action.Authorize, MessageType.call): [AuthorizeMiddleware],
     (Action.BootNotification, MessageType.call): [BootNotificationMiddleware],
@@ -52,66 +61,117 @@ DEFAULT_MIDDLEWARE_CONFIG = {
 }
 
 
-@lru_cache
+# stateless, so every chain ends in the same instance
+RESPONSE_MIDDLEWARE = ResponseMiddleware()
+
+# built chains by middleware classes, shared between keys configured alike
+BUILT_MIDDLEWARE = {}
+
+
 def get_middleware(middleware_classes: tuple):
-    middleware_classes = list(middleware_classes) + [ResponseMiddleware]
-    prev = None
-    cur = None
+    """Build the chain once and return its entry point, the head's bound handle"""
+    try:
+        return BUILT_MIDDLEWARE[middleware_classes]
+    except KeyError:
+        pass
+    cur = RESPONSE_MIDDLEWARE
     for klass in reversed(middleware_classes):
-        args = [prev] if prev else []
-        cur = klass(*args)
-        prev = cur
-    return cur
+        if not is_passthrough(klass):
+            cur = klass(cur)
+    handle = BUILT_MIDDLEWARE[middleware_classes] = cur.handle
+    return handle
+
+
+# chain entry points by (action, message type), built up front so that
+# dispatching a message is a single dict lookup
+MIDDLEWARE_CHAINS = {}
+
+
+def build_middleware_chains():
+    middleware_config = {**DEFAULT_MIDDLEWARE_CONFIG, **load_ocpp_middleware()}
+    MIDDLEWARE_CHAINS.clear()
+    MIDDLEWARE_CHAINS.update(
+        {
+            key: get_middleware(tuple(middleware_classes))
+            for key, middleware_classes in middleware_config.items()
+        }
+    )
+
+
+def get_middleware_chain(action: Action, message_type: MessageType):
+    try:
+        return MIDDLEWARE_CHAINS[(action, message_type)]
+    except KeyError:
+        # nothing configured for this key, only build the response
+        return get_middleware(())
+
+
+@receiver(setting_changed)
+def rebuild_middleware_chains(setting, **kwargs):
+    if setting == "OCPP_MIDDLEWARE":
+        build_middleware_chains()
+
+
+build_middleware_chains()
 
 
 class MessageTypeHandler(abc.ABC):
+    __slots__ = ()
+
     @abc.abstractmethod
     def handle(self, message: Message):
         pass
 
 
 class ChargePointCallHandler(MessageTypeHandler):
+    __slots__ = ()
+
     def handle(self, message: Message):
-        message_type = MessageType(message.message_type)
-        action = Action(message.action)
-        custom_middleware_config = load_ocpp_middleware()
-        middleware_classes = custom_middleware_config.get(
-            (action, message_type),
-            DEFAULT_MIDDLEWARE_CONFIG.get((action, message_type), []),
-        )
-        middleware = get_middleware(tuple(middleware_classes))
-        res = middleware.handle(OCPPRequest(message=message, extra={}))
-        res.message.data = json_decode(
-            json_encode(res.message.data)
-        )  # make serializable
-        res.message.save()
-        message.reply = res.message
-        message.save(update_fields=["reply"])
+        message_type = MESSAGE_TYPES[message.message_type]
+        action = ACTIONS[message.action]
+        handle = get_middleware_chain(action, message_type)
+        # one commit for everything the middlewares write, replies go out after it
+        with db_transaction.atomic():
+            res = handle(OCPPRequest(message=message, extra={}))
+            res.message.data = json_normalize(res.message.data)  # make serializable
+            res.message.save()
+            message.reply = res.message
+            message.save(update_fields=["reply", "transaction"])
+            for side_effect_message in res.side_effects:
+                side_effect_message.save()
         charge_point = res.message.charge_point
         ChargePointService.send_message_to_charge_point(charge_point, res.message)
         # TODO: WS will need outbound message queueing if more than one side effect is returned
         for side_effect_message in res.side_effects:
-            side_effect_message.save()
             ChargePointService.send_message_to_charge_point(
                 charge_point, side_effect_message
             )
 
 
 class ChargePointCallResultHandler(MessageTypeHandler):
+    __slots__ = ()
+
     def handle(self, message: Message):
-        # just link the originating call to the result message
-        originating_call = Message.objects.get(
-            unique_id=message.unique_id, message_type=MessageType.call
+        # just link the originating call to the result message, in the database
+        # unique ids are only unique per connection, and the call came from us
+        originating_call = Message.objects.filter(
+            charge_point_id=message.charge_point_id,
+            actor=ActorType.central_system,
+            unique_id=message.unique_id,
+            message_type=MessageType.call,
+        )
+        if not originating_call.update(reply=message):
+            raise Message.DoesNotExist(
+                "No call found for result {}".format(message.unique_id)
+            )
+        Message.objects.filter(pk=message.pk).update(
+            action=Subquery(originating_call.values("action")[:1])
         )
-        originating_call.reply = message
-        originating_call.save(update_fields=["reply"])
-        message.action = originating_call.action
-        message.save(update_fields=["action"])
         # TODO: middleware for call_result and call_error
 
 
 class ChargePointCallErrorHandler(ChargePointCallResultHandler):
-    pass
+    __slots__ = ()
 
 
 MESSAGE_TYPE_HANDLERS = {
@@ -119,13 +179,14 @@ MESSAGE_TYPE_HANDLERS = {
     MessageType.call_result: ChargePointCallResultHandler(),
     MessageType.call_error: ChargePointCallErrorHandler(),
 }
+# also keyed by raw message type, so dispatch works whether the message holds
+# the enum member (freshly built) or the stored integer, without coercing it
+MESSAGE_TYPE_HANDLERS.update({k.value: v for k, v in MESSAGE_TYPE_HANDLERS.items()})
 
 
 class ChargePointMessageHandler:
     @staticmethod
     def handle_message_from_charge_point(message: Message):
-        assert (
-            ActorType(message.actor) == ActorType.charge_point
-        ), "Expected message from charge point"
-        message_type = MessageType(message.message_type)
-        MESSAGE_TYPE_HANDLERS[message_type].handle(message)
+        if ACTOR_TYPES[message.actor] != ActorType.charge_point:
+            raise ValueError("Expected message from charge point")
+        MESSAGE_TYPE_HANDLERS[message.message_type].handle(message)
@@ -1,4 +1,3 @@
-import abc
 import logging
 
 from ocpp.models import Message
@@ -13,10 +12,16 @@ queue_publisher = QueuePublisher()
 class ChargePointService:
     @classmethod
     def update_or_create_charge_point(cls, charge_point_id: str, **kwargs):
-        charge_point, _ = ChargePoint.objects.update_or_create(
-            id=charge_point_id, defaults=kwargs
+        # a single INSERT ... ON CONFLICT DO UPDATE, that only writes the given
+        # fields to an existing row
+        ChargePoint.objects.bulk_create(
+            [ChargePoint(id=charge_point_id, **kwargs)],
+            update_conflicts=True,
+            update_fields=[*kwargs, "updated_at"],
+            unique_fields=["id"],
         )
-        return charge_point
+        # the upsert only returns the key, load the whole row once
+        return ChargePoint.objects.get(pk=charge_point_id)
 
     @classmethod
     def send_message_to_charge_point(cls, charge_point: ChargePoint, message: Message):
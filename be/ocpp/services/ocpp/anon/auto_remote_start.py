@@ -13,14 +13,16 @@ class AutoRemoteStartMiddleware(OCPPMiddleware):
     When a charge point transitions to Preparing, automatically start a transaction, using an anonymous ID tag
     """
 
+    __slots__ = ()
+
     def handle(self, req: OCPPRequest) -> OCPPResponse:
-        res = self.next.handle(req)
+        res = self.next_handle(req)
         message = req.message
         assert Action(message.action) == Action.StatusNotification
         if ChargePointStatus(message.data["status"]) == ChargePointStatus.Preparing:
             charge_point = message.charge_point
             res.side_effects.append(
-                Message.objects.create(
+                Message(
                     charge_point=charge_point,
                     action=Action.RemoteStartTransaction,
                     actor=ActorType.central_system,
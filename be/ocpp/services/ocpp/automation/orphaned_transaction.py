@@ -1,9 +1,12 @@
 import logging
 
-from ocpp.models import Transaction
+from django.db.models import OuterRef, Subquery
+
+from ocpp.models import MeterValue, Transaction
 from ocpp.services.ocpp.base import OCPPMiddleware, OCPPRequest, OCPPResponse
 from ocpp.types.action import Action
 from ocpp.types.stop_reason import StopReason
+from ocpp.utils.date import utc_now
 
 logger = logging.getLogger(__name__)
 
@@ -13,25 +16,35 @@ class OrphanedTransactionMiddleware(OCPPMiddleware):
     When a new transaction is started, close out any unclosed previous transactions for the same CP
     """
 
+    __slots__ = ()
+
     def handle(self, req: OCPPRequest) -> OCPPResponse:
         message = req.message
         assert Action(message.action) == Action.StartTransaction
-        for orphaned_tx in Transaction.objects.filter(
-            charge_point=message.charge_point, stopped_at__isnull=True
-        ):
-            last_meter_value = (
-                orphaned_tx.metervalue_set.filter(
-                    measurand="Energy.Active.Import.Register"
-                )
-                .order_by("timestamp")
-                .last()
-            )
-            meter_stop = last_meter_value.value if last_meter_value else 0
-            orphaned_tx.stop(StopReason.Other, meter_stop)
-            logger.info(
-                "Stopped orphaned transaction %s with meter value %d",
-                orphaned_tx,
-                meter_stop,
+        # the last energy reading of each orphan comes along with it in one query
+        last_energy_value = (
+            MeterValue.objects.filter(
+                transaction=OuterRef("pk"), measurand="Energy.Active.Import.Register"
             )
+            .order_by("-timestamp")
+            .values("value")[:1]
+        )
+        orphaned_txs = list(
+            Transaction.objects.filter(
+                charge_point=message.charge_point, stopped_at__isnull=True
+            ).annotate(last_energy_value=Subquery(last_energy_value))
+        )
+        if orphaned_txs:
+            now = utc_now()
+            for orphaned_tx in orphaned_txs:
+                meter_stop = orphaned_tx.last_energy_value or 0
+                orphaned_tx.mark_stopped(StopReason.Other, meter_stop, now)
+                logger.info(
+                    "Stopped orphaned transaction %s with meter value %d",
+                    orphaned_tx,
+                    meter_stop,
+                )
+            Transaction.objects.bulk_update(orphaned_txs, Transaction.STOP_FIELDS)
+            message.charge_point.update(last_tx_stop_at=now)
 
-        return self.next.handle(req)
+        return self.next_handle(req)
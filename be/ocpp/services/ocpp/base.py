@@ -23,9 +23,12 @@ class OCPPResponse:
 
 
 class ResponseMiddleware:
+    __slots__ = ()
+
     def handle(self, req: OCPPRequest):
+        # left unsaved: it is persisted once middlewares have filled in the reply data
         return OCPPResponse(
-            message=Message.objects.create(
+            message=Message(
                 charge_point=req.message.charge_point,
                 actor=ActorType.central_system,
                 unique_id=req.message.unique_id,
@@ -39,9 +42,28 @@ class ResponseMiddleware:
 
 
 class OCPPMiddleware(abc.ABC):
+    __slots__ = ("next_handle",)
+
+    # middlewares that only forward to the next one are left out of built chains,
+    # the flag is only read from the class that defines handle (see is_passthrough)
+    passthrough = False
+
     def __init__(self, next_middleware):
-        self.next = next_middleware
+        # bound once, so each hop down the chain is a plain call
+        self.next_handle = next_middleware.handle
 
     @abc.abstractmethod
     def handle(self, req: OCPPRequest) -> OCPPResponse:
         pass
+
+
+def is_passthrough(middleware_class) -> bool:
+    """Whether a middleware only forwards to the next one
+
+    Read from the class that defines handle, so a subclass that overrides
+    handle is not taken for a pass-through because its parent is one.
+    """
+    for klass in middleware_class.__mro__:
+        if "handle" in vars(klass):
+            return vars(klass).get("passthrough", False)
+    return False
@@ -3,8 +3,10 @@ from ocpp.types.authorization_status import AuthorizationStatus
 
 
 class AuthorizeMiddleware(OCPPMiddleware):
+    __slots__ = ()
+
     def handle(self, req: OCPPRequest) -> OCPPResponse:
-        res = self.next.handle(req)
+        res = self.next_handle(req)
         # by default, we simply accept every idTag for now
         res.message.data.update(
             dict(
@@ -6,31 +6,24 @@ from ocpp.utils.date import utc_now
 
 
 class BootNotificationMiddleware(OCPPMiddleware):
+    __slots__ = ()
+
     def handle(self, req: OCPPRequest) -> OCPPResponse:
         message = req.message
-        charge_point = message.charge_point
-        charge_point.hw_firmware = message.data.get("firmwareVersion", "")
-        charge_point.hw_model = message.data.get("chargePointModel", "")
-        charge_point.hw_vendor = message.data.get("chargePointVendor", "")
-        charge_point.hw_serial = message.data.get("chargePointSerialNumber", "")
-        charge_point.hw_iccid = message.data.get("iccid", "")
-        charge_point.hw_imsi = message.data.get("imsi", "")
-        charge_point.last_boot_at = utc_now()
-        charge_point.save(
-            update_fields=[
-                "hw_firmware",
-                "hw_model",
-                "hw_vendor",
-                "hw_serial",
-                "last_boot_at",
-                "hw_iccid",
-                "hw_imsi",
-            ]
+        now = utc_now()
+        message.charge_point.update(
+            hw_firmware=message.data.get("firmwareVersion", ""),
+            hw_model=message.data.get("chargePointModel", ""),
+            hw_vendor=message.data.get("chargePointVendor", ""),
+            hw_serial=message.data.get("chargePointSerialNumber", ""),
+            hw_iccid=message.data.get("iccid", ""),
+            hw_imsi=message.data.get("imsi", ""),
+            last_boot_at=now,
         )
-        res = self.next.handle(req)
+        res = self.next_handle(req)
         res.message.data.update(
             dict(
-                currentTime=utc_now(),
+                currentTime=now,
                 interval=settings.OCPP_HEARTBEAT_INTERVAL,
                 status=RegistrationStatus.Accepted,
             )
@@ -3,8 +3,10 @@ from ocpp.types.data_transfer_status import DataTransferStatus
 
 
 class DataTransferMiddleware(OCPPMiddleware):
+    __slots__ = ()
+
     def handle(self, req: OCPPRequest) -> OCPPResponse:
-        res = self.next.handle(req)
+        res = self.next_handle(req)
         # reject all data transfer requests by default
         res.message.data.update(
             dict(
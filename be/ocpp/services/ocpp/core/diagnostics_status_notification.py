@@ -2,5 +2,9 @@ from ocpp.services.ocpp.base import OCPPMiddleware, OCPPResponse, OCPPRequest
 
 
 class DiagnosticsStatusNotificationMiddleware(OCPPMiddleware):
+    __slots__ = ()
+
+    passthrough = True
+
     def handle(self, req: OCPPRequest) -> OCPPResponse:
-        return self.next.handle(req)
+        return self.next_handle(req)
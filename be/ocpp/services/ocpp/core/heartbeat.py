@@ -3,10 +3,11 @@ from ocpp.utils.date import utc_now
 
 
 class HeartbeatMiddleware(OCPPMiddleware):
+    __slots__ = ()
+
     def handle(self, req: OCPPRequest) -> OCPPResponse:
-        charge_point = req.message.charge_point
-        charge_point.last_heartbeat_at = utc_now()
-        charge_point.save(update_fields=["last_heartbeat_at"])
-        res = self.next.handle(req)
-        res.message.data.update(dict(currentTime=utc_now()))
+        now = utc_now()
+        req.message.charge_point.update(last_heartbeat_at=now)
+        res = self.next_handle(req)
+        res.message.data.update(dict(currentTime=now))
         return res
@@ -5,21 +5,21 @@ from ocpp.utils.date import utc_now
 
 
 class StartTransactionMiddleware(OCPPMiddleware):
+    __slots__ = ()
+
     def handle(self, req: OCPPRequest) -> OCPPResponse:
         message = req.message
+        now = utc_now()
         transaction = Transaction.objects.create(
             charge_point=message.charge_point,
             connector_id=message.data["connectorId"],
             id_tag=message.data["idTag"],
             meter_start=message.data["meterStart"],
-            started_at=utc_now(),
+            started_at=now,
         )
         message.transaction = transaction
-        message.save(update_fields=["transaction"])
-        charge_point = message.charge_point
-        charge_point.last_tx_start_at = utc_now()
-        charge_point.save(update_fields=["last_tx_start_at"])
-        res = self.next.handle(req)
+        message.charge_point.update(last_tx_start_at=now)
+        res = self.next_handle(req)
         res.message.data.update(
             dict(
                 transactionId=transaction.id,
@@ -1,21 +1,19 @@
 from ocpp.services.ocpp.base import OCPPMiddleware, OCPPRequest, OCPPResponse
 from ocpp.types.charge_point_status import ChargePointStatus
+from ocpp.utils.model.model_enum import MemberLookup
+
+CHARGE_POINT_STATUSES = MemberLookup(ChargePointStatus)
 
 
 class StatusNotificationMiddleware(OCPPMiddleware):
+    __slots__ = ()
+
     def handle(self, req: OCPPRequest) -> OCPPResponse:
         message = req.message
-        charge_point = message.charge_point
-        charge_point.status = ChargePointStatus(message.data["status"])
-        charge_point.vendor_error_code = message.data.get("vendorErrorCode") or ""
-        charge_point.vendor_status_info = message.data.get("info") or ""
-        charge_point.vendor_status_id = message.data.get("vendorId") or ""
-        charge_point.save(
-            update_fields=[
-                "status",
-                "vendor_error_code",
-                "vendor_status_info",
-                "vendor_status_id",
-            ]
+        message.charge_point.update(
+            status=CHARGE_POINT_STATUSES[message.data["status"]],
+            vendor_error_code=message.data.get("vendorErrorCode") or "",
+            vendor_status_info=message.data.get("info") or "",
+            vendor_status_id=message.data.get("vendorId") or "",
         )
-        return self.next.handle(req)
+        return self.next_handle(req)
@@ -5,17 +5,16 @@ from ocpp.types.stop_reason import StopReason
 
 
 class StopTransactionMiddleware(OCPPMiddleware):
+    __slots__ = ()
+
     def handle(self, req: OCPPRequest) -> OCPPResponse:
         message = req.message
         transaction = message.transaction_from_data()
         transaction.stop(StopReason(message.data["reason"]), message.data["meterStop"])
-        transaction_data = message.data.get("transactionData") or []
-        for meter_value in transaction_data:
-            for sampled_value in meter_value["sampledValue"]:
-                MeterValue.create_from_json(
-                    transaction, meter_value["timestamp"], sampled_value, is_final=True
-                )
-        res = self.next.handle(req)
+        MeterValue.bulk_create_from_json(
+            transaction, message.data.get("transactionData") or [], is_final=True
+        )
+        res = self.next_handle(req)
         res.message.data.update(
             dict(idTagInfo=dict(status=AuthorizationStatus.Accepted)),
         )
@@ -1,37 +1,78 @@
-import json
 import logging
 
+import orjson
 import pika
 import pika.exceptions
 import time
 from django.conf import settings
+from django.db import close_old_connections
 from pika.connection import URLParameters
 
 logger = logging.getLogger(__name__)
 
+ACK_INTERVAL = 0.25
+
+
+class BatchedAckDeliveries:
+    """Handles the deliveries of one connection, acking them in batches
+
+    Delivery is at least once: handled deliveries that are not acked yet (up to
+    ack_batch_size of them, or ACK_INTERVAL worth) are redelivered if the
+    consumer crashes or loses its connection, and handled again.
+    """
+
+    def __init__(self, connection, channel, fn, ack_batch_size):
+        self.connection = connection
+        self.channel = channel
+        self.fn = fn
+        self.ack_batch_size = ack_batch_size
+        # delivery tags handled since the last ack, acked together with multiple=True
+        self.pending = []
+
+    def ack_pending(self):
+        if self.pending:
+            self.channel.basic_ack(delivery_tag=self.pending[-1], multiple=True)
+            self.pending.clear()
+
+    def ack_periodically(self):
+        self.ack_pending()
+        # replace the database connection once it is past CONN_MAX_AGE, between
+        # messages rather than before each one
+        close_old_connections()
+        self.connection.call_later(ACK_INTERVAL, self.ack_periodically)
+
+    def on_message(self, channel, method_frame, header_frame, body):
+        try:
+            self.fn(orjson.loads(body))
+        except Exception:
+            # TODO: identify cases where we might want to nack the message and have it re-deliver
+            logger.exception("AMQP MESSAGE")
+            # the database connection may be what broke, drop it if it is unusable
+            close_old_connections()
+        self.pending.append(method_frame.delivery_tag)
+        if len(self.pending) >= self.ack_batch_size:
+            self.ack_pending()
+
 
 class QueueConsumer:
     @staticmethod
     def consume(queue, fn):
+        prefetch_count = settings.AMQP_PREFETCH_COUNT
+        ack_batch_size = max(prefetch_count // 2, 1)
         while True:
             try:
                 logger.info("AMQP CONSUMER CONNECTING")
                 connection = pika.BlockingConnection(URLParameters(settings.AMQP_URL))
                 channel = connection.channel()
-                channel.basic_qos(prefetch_count=1)
+                channel.basic_qos(prefetch_count=prefetch_count)
                 channel.queue_declare(queue)
-
-                def _callback(channel, method_frame, header_frame, body):
-                    try:
-                        fn(json.loads(body))
-                    except Exception:
-                        # TODO: identify cases where we might want to nack the message and have it re-deliver
-                        logger.exception("AMQP MESSAGE")
-                    channel.basic_ack(delivery_tag=method_frame.delivery_tag)
-
-                channel.basic_consume(queue, _callback)
+                deliveries = BatchedAckDeliveries(
+                    connection, channel, fn, ack_batch_size
+                )
+                connection.call_later(ACK_INTERVAL, deliveries.ack_periodically)
+                channel.basic_consume(queue, deliveries.on_message)
                 channel.start_consuming()
-            except pika.exceptions.AMQPChannelError as e:
+            except pika.exceptions.AMQPChannelError:
                 logger.exception("AMQP CONSUMER")
                 break
             except (
@@ -1,16 +1,19 @@
 import logging
 import threading
+import time
 
 import pika
 from django.conf import settings
 from pika import URLParameters
 from pika.exceptions import AMQPError
-from retry import retry
 
-from ocpp.utils.serialization import json_encode
+from ocpp.utils.serialization import json_encode_bytes
 
 logger = logging.getLogger(__name__)
 
+PUBLISH_TRIES = 5
+PUBLISH_RETRY_DELAY = 1
+
 
 class QueuePublisher:
     def __init__(self):
@@ -27,13 +30,23 @@ class QueuePublisher:
     def _channel(self):
         return self._tl.channel
 
-    @retry(AMQPError, tries=5, delay=1, backoff=2)
     def publish(self, queue, message):
-        body = json_encode(message)
-        logger.info("SEND %s", body)
-        self._reconnect()
-        self._channel.basic_publish(
-            exchange="",
-            routing_key=queue,
-            body=body.encode(),
-        )
+        body = json_encode_bytes(message)
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("SEND %s", body.decode())
+        delay = PUBLISH_RETRY_DELAY
+        for attempt in range(PUBLISH_TRIES):
+            try:
+                self._reconnect()
+                self._channel.basic_publish(
+                    exchange="",
+                    routing_key=queue,
+                    body=body,
+                )
+                return
+            except AMQPError:
+                if attempt == PUBLISH_TRIES - 1:
+                    raise
+                logger.warning("AMQP PUBLISH failed, retrying in %ss", delay)
+                time.sleep(delay)
+                delay *= 2
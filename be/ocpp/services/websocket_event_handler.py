@@ -1,7 +1,8 @@
 import abc
-import json
 import logging
 
+from django.db import transaction as db_transaction
+
 from ocpp.models.charge_point import ChargePoint
 from ocpp.models.message import Message
 from ocpp.models.websocket_event import WebsocketEvent
@@ -13,54 +14,63 @@ from ocpp.utils.date import utc_now
 logger = logging.getLogger(__name__)
 
 
-class WebsocketEventHandler(abc.ABC):
+class WebsocketEventTypeHandler(abc.ABC):
+    __slots__ = ()
+
     @abc.abstractmethod
     def handle(self, charge_point: ChargePoint, event: dict):
         pass
 
 
-class ConnectHandler(WebsocketEventHandler):
+class ConnectHandler(WebsocketEventTypeHandler):
+    __slots__ = ()
+
     def handle(self, charge_point: ChargePoint, event: dict):
-        charge_point.is_connected = True
-        charge_point.last_connect_at = utc_now()
-        charge_point.save(update_fields=["is_connected", "last_connect_at"])
-        WebsocketEvent.objects.create(
-            charge_point=charge_point,
-            timestamp=utc_now(),
-            type=WebsocketEventType.connect,
-        )
+        now = utc_now()
+        with db_transaction.atomic():
+            charge_point.update(is_connected=True, last_connect_at=now)
+            WebsocketEvent.objects.create(
+                charge_point=charge_point,
+                timestamp=now,
+                type=WebsocketEventType.connect,
+            )
 
 
-class DisconnectHandler(WebsocketEventHandler):
+class DisconnectHandler(WebsocketEventTypeHandler):
+    __slots__ = ()
+
     def handle(self, charge_point: ChargePoint, event: dict):
-        charge_point.is_connected = False
-        charge_point.save(update_fields=["is_connected"])
-        WebsocketEvent.objects.create(
-            charge_point=charge_point,
-            timestamp=utc_now(),
-            type=WebsocketEventType.disconnect,
-        )
+        with db_transaction.atomic():
+            charge_point.update(is_connected=False)
+            WebsocketEvent.objects.create(
+                charge_point=charge_point,
+                timestamp=utc_now(),
+                type=WebsocketEventType.disconnect,
+            )
+
 
+class ReceiveHandler(WebsocketEventTypeHandler):
+    __slots__ = ()
 
-class ReceiveHandler(WebsocketEventHandler):
     def handle(self, charge_point: ChargePoint, event: dict):
+        # stored before it is handled, so it is kept even if handling fails
         message = Message.from_occp(charge_point, event)
         ChargePointMessageHandler.handle_message_from_charge_point(message)
 
 
+# keyed by raw event type so dispatch needs no enum coercion
 WEBSOCKET_HANDLERS = {
-    WebsocketEventType.connect: ConnectHandler(),
-    WebsocketEventType.disconnect: DisconnectHandler(),
-    WebsocketEventType.receive: ReceiveHandler(),
+    WebsocketEventType.connect.value: ConnectHandler(),
+    WebsocketEventType.disconnect.value: DisconnectHandler(),
+    WebsocketEventType.receive.value: ReceiveHandler(),
 }
 
 
 class WebsocketEventHandler:
     @classmethod
     def handle_websocket_event(cls, event: dict):
-        logger.info("RECV %s", json.dumps(event))
+        logger.info("RECV %s", event)
         charge_point = ChargePointService.update_or_create_charge_point(
             event["id"], ws_queue=event["queue"]
         )
-        event_type = WebsocketEventType(event["type"])
-        WEBSOCKET_HANDLERS[event_type].handle(charge_point, event)
+        WEBSOCKET_HANDLERS[event["type"]].handle(charge_point, event)
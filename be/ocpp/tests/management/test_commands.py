@@ -0,0 +1,208 @@
+import csv
+import datetime
+import io
+from unittest.mock import patch
+
+from django.core.management import call_command
+from django.test import TestCase
+
+from ocpp.management.commands import correct_meter_values
+from ocpp.models import MeterValue, Transaction
+from ocpp.tests.factory import (
+    ChargePointFactory,
+    MeterValueFactory,
+    TransactionFactory,
+)
+
+ENERGY = "Energy.Active.Import.Register"
+
+
+def call_csv_command(*args, **options):
+    """Run a command writing csv to stdout and return the parsed rows"""
+    stdout = io.TextIOWrapper(io.BytesIO(), encoding="utf-8", newline="")
+    with patch("sys.stdout", stdout):
+        call_command(*args, **options)
+    stdout.flush()
+    return list(csv.reader(io.StringIO(stdout.buffer.getvalue().decode("utf-8"))))
+
+
+class CommandTest(TestCase):
+    def setUp(self):
+        charge_point = ChargePointFactory(id="CP1", name="one")
+        self.transactions = []
+        for i, values in enumerate(
+            [
+                [100, 200, 15000, 15100, 30000],
+                # a jump from a zero reading is not a meter fault
+                [0, 20000, 20100],
+                [100, 200, 15000, 15100, 30000],
+            ]
+        ):
+            started_at = datetime.datetime(2023, 5, 1, 10 + i, tzinfo=datetime.UTC)
+            transaction = TransactionFactory(
+                charge_point=charge_point,
+                started_at=started_at,
+                stopped_at=started_at + datetime.timedelta(minutes=50),
+                meter_stop=30000 + i,
+            )
+            for j, value in enumerate(values):
+                timestamp = started_at + datetime.timedelta(minutes=10 * j)
+                MeterValueFactory(
+                    transaction=transaction,
+                    timestamp=timestamp,
+                    measurand=ENERGY,
+                    value=value,
+                )
+                # only energy readings are checked for jumps
+                MeterValueFactory(
+                    transaction=transaction,
+                    timestamp=timestamp,
+                    measurand="Power.Active.Import",
+                    value=value * 1000,
+                )
+            self.transactions.append(transaction)
+
+    def jump_ids(self, transaction):
+        return list(
+            MeterValue.objects.filter(
+                transaction=transaction, measurand=ENERGY, value__in=[15000, 30000]
+            )
+            .order_by("timestamp")
+            .values_list("id", flat=True)
+        )
+
+    def expected_corrections(self, hour, transaction):
+        first, second = self.jump_ids(transaction)
+        return [
+            [f"2023-05-01 {hour}:20:00", "CP1 / one", str(transaction.id), str(first)]
+            + ["200.0", "15000.0", "14800.0", str(transaction.meter_stop), "-29700.0"],
+            [f"2023-05-01 {hour}:40:00", "CP1 / one", str(transaction.id), str(second)]
+            + [
+                "15100.0",
+                "30000.0",
+                "14900.0",
+                str(transaction.meter_stop),
+                "-29700.0",
+            ],
+        ]
+
+    def assert_corrected(self, *corrected):
+        for transaction in self.transactions:
+            transaction.refresh_from_db()
+            expected = -29700 if transaction in corrected else 0
+            assert transaction.meter_correction == expected
+        assert sorted(
+            MeterValue.objects.filter(is_incorrect=True).values_list("id", flat=True)
+        ) == sorted(sum((self.jump_ids(t) for t in corrected), []))
+
+
+class RunReportTest(CommandTest):
+    def test_transaction_report(self):
+        rows = call_csv_command(
+            "run_report", "transaction", "2023-05-01", "2023-05-02", "--tz=UTC"
+        )
+        assert rows == [
+            [
+                "id",
+                "charge_point",
+                "started_at",
+                "stopped_at",
+                "meter",
+                "meter_correction",
+                "stop_reason",
+            ]
+        ] + [
+            [
+                str(transaction.id),
+                "CP1 / one",
+                f"2023-05-01 {10 + i}:00:00",
+                f"2023-05-01 {10 + i}:50:00",
+                str(30000 + i),
+                "0",
+                "",
+            ]
+            for i, transaction in enumerate(self.transactions)
+        ]
+
+    def test_range_in_time_zone(self):
+        # the first transaction stops at 19:50 in Tokyo, before the range
+        rows = call_csv_command(
+            "run_report",
+            "transaction",
+            "2023-05-01T20:00",
+            "2023-05-02",
+            "--tz=Asia/Tokyo",
+        )
+        assert [row[:4] for row in rows[1:]] == [
+            [
+                str(self.transactions[1].id),
+                "CP1 / one",
+                "2023-05-01 20:00:00",
+                "2023-05-01 20:50:00",
+            ],
+            [
+                str(self.transactions[2].id),
+                "CP1 / one",
+                "2023-05-01 21:00:00",
+                "2023-05-01 21:50:00",
+            ],
+        ]
+
+
+class CorrectMeterValuesTest(CommandTest):
+    def test_correct(self):
+        rows = call_csv_command(
+            "correct_meter_values", "2023-05-01", "2023-05-02", "--tz=UTC"
+        )
+        assert rows == [
+            [
+                "timestamp",
+                "charge_point",
+                "transaction.id",
+                "meter_value.id",
+                "meter_value.prev",
+                "meter_value.cur",
+                "meter_value.delta",
+                "transaction.meter_stop",
+                "transaction.meter_correction",
+            ],
+            *self.expected_corrections("10", self.transactions[0]),
+            *self.expected_corrections("12", self.transactions[2]),
+        ]
+        self.assert_corrected(self.transactions[0], self.transactions[2])
+
+    def test_dry_run(self):
+        rows = call_csv_command(
+            "correct_meter_values",
+            "2023-05-01",
+            "2023-05-02",
+            "--tz=America/Vancouver",
+            "--dry-run",
+        )
+        assert rows[1:] == [
+            *self.expected_corrections("03", self.transactions[0]),
+            *self.expected_corrections("05", self.transactions[2]),
+        ]
+        self.assert_corrected()
+
+    def test_batches_are_written_separately(self):
+        bulk_update = Transaction.objects.bulk_update
+
+        def fail_second_batch(*args, **kwargs):
+            if fail_second_batch.calls:
+                raise RuntimeError("write failed")
+            fail_second_batch.calls += 1
+            return bulk_update(*args, **kwargs)
+
+        fail_second_batch.calls = 0
+        # every transaction has two jumps, a batch of two flushes each one
+        with patch.object(correct_meter_values, "BULK_UPDATE_BATCH_SIZE", 2):
+            with patch.object(
+                Transaction.objects, "bulk_update", side_effect=fail_second_batch
+            ):
+                with self.assertRaises(RuntimeError):
+                    call_csv_command(
+                        "correct_meter_values", "2023-05-01", "2023-05-02", "--tz=UTC"
+                    )
+        # the first batch is kept, the failed one is rolled back as a whole
+        self.assert_corrected(self.transactions[0])
@@ -0,0 +1,29 @@
+from unittest.mock import patch
+
+from django.test import TestCase
+
+from ocpp.models import Message
+from ocpp.services.charge_point_message_handler import ChargePointMessageHandler
+from ocpp.tests.factory import ChargePointFactory
+
+
+@patch(
+    "ocpp.services.charge_point_service.ChargePointService.send_message_to_charge_point"
+)
+class HeartbeatTest(TestCase):
+    def setUp(self) -> None:
+        self.charge_point = ChargePointFactory()
+
+    def test_heartbeat(self, send_message_to_charge_point):
+        message = Message.from_occp(
+            self.charge_point,
+            dict(message=[2, "03.00003282c0eb8ce0h", "Heartbeat", {}]),
+        )
+        # no lazy loads of the charge point: update it, save the reply, link it,
+        # plus the savepoint pair of the handler's atomic block inside the test
+        with self.assertNumQueries(5):
+            ChargePointMessageHandler.handle_message_from_charge_point(message)
+        self.charge_point.refresh_from_db()
+        assert self.charge_point.last_heartbeat_at
+        reply = send_message_to_charge_point.mock_calls[0][1][1]
+        assert reply.data["currentTime"]
@@ -0,0 +1,69 @@
+from unittest.mock import patch
+
+from django.test import TestCase
+
+from ocpp.models import Message, MeterValue
+from ocpp.services.charge_point_message_handler import ChargePointMessageHandler
+from ocpp.tests.factory import ChargePointFactory, TransactionFactory
+from ocpp.utils.date import utc_now
+
+
+@patch(
+    "ocpp.services.charge_point_service.ChargePointService.send_message_to_charge_point"
+)
+class MeterValuesTest(TestCase):
+    def setUp(self) -> None:
+        self.charge_point = ChargePointFactory()
+        self.transaction = TransactionFactory(
+            charge_point=self.charge_point, started_at=utc_now()
+        )
+
+    def test_meter_values(self, send_message_to_charge_point):
+        message = Message.from_occp(
+            self.charge_point,
+            dict(
+                message=[
+                    2,
+                    "03.00003282c0eb8ce0m",
+                    "MeterValues",
+                    {
+                        "connectorId": 1,
+                        "transactionId": self.transaction.id,
+                        "meterValue": [
+                            {
+                                "timestamp": "2023-03-30T02:03:48.001Z",
+                                "sampledValue": [
+                                    {
+                                        "value": "1250",
+                                        "measurand": "Energy.Active.Import.Register",
+                                        "unit": "Wh",
+                                    },
+                                    {
+                                        "value": "16.1",
+                                        "measurand": "Current.Import",
+                                        "unit": "A",
+                                        "phase": "L1",
+                                    },
+                                ],
+                            },
+                            {
+                                "timestamp": "2023-03-30T02:04:48.001Z",
+                                "sampledValue": [{"value": "1500"}],
+                            },
+                        ],
+                    },
+                ]
+            ),
+        )
+        ChargePointMessageHandler.handle_message_from_charge_point(message)
+        meter_values = list(
+            MeterValue.objects.filter(transaction=self.transaction).order_by(
+                "timestamp", "id"
+            )
+        )
+        assert [mv.value for mv in meter_values] == [1250, 16.1, 1500]
+        assert meter_values[1].phase == "L1"
+        assert meter_values[2].measurand == "Energy.Active.Import.Register"
+        assert meter_values[2].context == "Sample.Periodic"
+        assert meter_values[0].timestamp == meter_values[1].timestamp
+        assert not any(mv.is_final for mv in meter_values)
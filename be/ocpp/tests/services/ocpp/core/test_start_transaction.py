@@ -0,0 +1,42 @@
+from unittest.mock import patch
+
+from django.test import TestCase
+
+from ocpp.models import Message, Transaction
+from ocpp.services.charge_point_message_handler import ChargePointMessageHandler
+from ocpp.tests.factory import ChargePointFactory
+
+
+@patch(
+    "ocpp.services.charge_point_service.ChargePointService.send_message_to_charge_point"
+)
+class StartTransactionTest(TestCase):
+    def setUp(self) -> None:
+        self.charge_point = ChargePointFactory()
+
+    def test_start_transaction(self, send_message_to_charge_point):
+        message = Message.from_occp(
+            self.charge_point,
+            dict(
+                message=[
+                    2,
+                    "03.00003282c0eb8ce0s",
+                    "StartTransaction",
+                    {
+                        "idTag": "anonymous",
+                        "timestamp": "2023-03-30T01:58:52.001Z",
+                        "connectorId": 1,
+                        "meterStart": 1200,
+                    },
+                ]
+            ),
+        )
+        ChargePointMessageHandler.handle_message_from_charge_point(message)
+        transaction = Transaction.objects.get(charge_point=self.charge_point)
+        assert transaction.meter_start == 1200
+        assert transaction.started_at
+        assert Message.objects.get(pk=message.pk).transaction_id == transaction.id
+        self.charge_point.refresh_from_db()
+        assert self.charge_point.last_tx_start_at == transaction.started_at
+        reply = send_message_to_charge_point.mock_calls[0][1][1]
+        assert reply.data["transactionId"] == transaction.id
@@ -0,0 +1,122 @@
+from django.test import SimpleTestCase, TestCase, override_settings
+
+from ocpp.models import Message
+from ocpp.services.charge_point_message_handler import (
+    ChargePointMessageHandler,
+    get_middleware,
+    get_middleware_chain,
+)
+from ocpp.services.ocpp.base import (
+    OCPPMiddleware,
+    OCPPRequest,
+    OCPPResponse,
+    ResponseMiddleware,
+)
+from ocpp.services.ocpp.core.data_transfer import DataTransferMiddleware
+from ocpp.services.ocpp.core.diagnostics_status_notification import (
+    DiagnosticsStatusNotificationMiddleware,
+)
+from ocpp.services.websocket_event_handler import WebsocketEventHandler
+from ocpp.tests.factory import ChargePointFactory
+from ocpp.types.action import Action
+from ocpp.types.actor_type import ActorType
+from ocpp.types.message_type import MessageType
+
+
+class FailingMiddleware(OCPPMiddleware):
+    __slots__ = ()
+
+    def handle(self, req: OCPPRequest) -> OCPPResponse:
+        raise ValueError("handling failed")
+
+
+class ReceiveTest(TestCase):
+    def setUp(self) -> None:
+        self.charge_point = ChargePointFactory()
+
+    @override_settings(
+        OCPP_MIDDLEWARE={
+            ("Heartbeat", 2): [
+                "ocpp.tests.services.test_charge_point_message_handler.FailingMiddleware"
+            ]
+        }
+    )
+    def test_call_kept_when_handling_fails(self):
+        event = dict(
+            type="receive",
+            id=self.charge_point.id,
+            queue="ws1",
+            message=[2, "03.00003282c0eb8ce0f", "Heartbeat", {}],
+        )
+        with self.assertRaisesMessage(ValueError, "handling failed"):
+            WebsocketEventHandler.handle_websocket_event(event)
+        call = Message.objects.get(unique_id="03.00003282c0eb8ce0f")
+        assert call.reply_id is None
+        assert Message.objects.count() == 1
+
+
+class ChargePointCallResultTest(TestCase):
+    def setUp(self) -> None:
+        self.charge_point = ChargePointFactory()
+
+    def test_call_result(self):
+        call = Message.objects.create(
+            charge_point=self.charge_point,
+            action=Action.RemoteStartTransaction,
+            actor=ActorType.central_system,
+            unique_id="a8a1d0b5-5b6c-4d4a-9f0e-0e5c8f1e2f11",
+            message_type=MessageType.call,
+            data=dict(idTag="anonymous"),
+        )
+        message = Message.from_occp(
+            self.charge_point,
+            dict(message=[3, call.unique_id, {"status": "Accepted"}]),
+        )
+        with self.assertNumQueries(2):
+            ChargePointMessageHandler.handle_message_from_charge_point(message)
+        call.refresh_from_db()
+        message.refresh_from_db()
+        assert call.reply_id == message.id
+        assert Action(message.action) == Action.RemoteStartTransaction
+
+    def test_call_result_from_other_charge_point(self):
+        call = Message.objects.create(
+            charge_point=self.charge_point,
+            action=Action.RemoteStartTransaction,
+            actor=ActorType.central_system,
+            unique_id="1",
+            message_type=MessageType.call,
+            data=dict(idTag="anonymous"),
+        )
+        # the same unique id, but from a charge point we never sent it to
+        message = Message.from_occp(
+            ChargePointFactory(), dict(message=[3, "1", {"status": "Accepted"}])
+        )
+        with self.assertRaises(Message.DoesNotExist):
+            ChargePointMessageHandler.handle_message_from_charge_point(message)
+        call.refresh_from_db()
+        message.refresh_from_db()
+        assert call.reply_id is None
+        assert message.action is None
+
+
+class MiddlewareChainTest(SimpleTestCase):
+    def test_chain_follows_setting(self):
+        key = (Action.DataTransfer, MessageType.call)
+        assert isinstance(get_middleware_chain(*key).__self__, DataTransferMiddleware)
+        with override_settings(OCPP_MIDDLEWARE={("DataTransfer", 2): []}):
+            assert isinstance(get_middleware_chain(*key).__self__, ResponseMiddleware)
+        assert isinstance(get_middleware_chain(*key).__self__, DataTransferMiddleware)
+
+    def test_passthrough_subclass_overriding_handle_is_kept(self):
+        class Forwarding(DiagnosticsStatusNotificationMiddleware):
+            __slots__ = ()
+
+        class Overriding(DiagnosticsStatusNotificationMiddleware):
+            __slots__ = ()
+
+            def handle(self, req):
+                return self.next_handle(req)
+
+        assert isinstance(get_middleware((Forwarding,)).__self__, ResponseMiddleware)
+        assert isinstance(get_middleware((Overriding,)).__self__, Overriding)
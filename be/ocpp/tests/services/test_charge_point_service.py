@@ -0,0 +1,48 @@
+from django.test import TestCase
+
+from ocpp.models import ChargePoint
+from ocpp.services.charge_point_service import ChargePointService
+from ocpp.tests.factory import ChargePointFactory
+from ocpp.types.charge_point_status import ChargePointStatus
+
+
+class UpdateOrCreateChargePointTest(TestCase):
+    def test_create(self):
+        with self.assertNumQueries(2):
+            ChargePointService.update_or_create_charge_point("new", ws_queue="ws1")
+        assert ChargePoint.objects.get(id="new").ws_queue == "ws1"
+
+    def test_update_keeps_other_fields(self):
+        charge_point = ChargePointFactory(ws_queue="ws1")
+        # the upsert, then the whole row
+        with self.assertNumQueries(2):
+            upserted = ChargePointService.update_or_create_charge_point(
+                charge_point.id, ws_queue="ws2"
+            )
+        # fields that were not written are loaded, not defaulted or deferred
+        with self.assertNumQueries(0):
+            assert upserted.name == charge_point.name
+            assert upserted.last_heartbeat_at is None
+            str(upserted)
+        assert upserted.status == ChargePointStatus.Available.value
+        assert upserted.created_at == charge_point.created_at
+        updated = ChargePoint.objects.get(id=charge_point.id)
+        assert updated.ws_queue == "ws2"
+        assert updated.name == charge_point.name
+        assert updated.created_at == charge_point.created_at
+
+    def test_sees_writes_from_other_processes(self):
+        charge_point = ChargePointFactory(ws_queue="ws1")
+        first = ChargePointService.update_or_create_charge_point(
+            charge_point.id, ws_queue="ws1"
+        )
+        # another consumer handles a reconnect to a different websocket worker
+        ChargePoint.objects.filter(pk=charge_point.pk).update(
+            ws_queue="ws2", is_connected=True
+        )
+        second = ChargePointService.update_or_create_charge_point(
+            charge_point.id, ws_queue="ws2"
+        )
+        assert second.ws_queue == "ws2"
+        assert second.is_connected
+        assert second.updated_at > first.updated_at
@@ -0,0 +1,38 @@
+from unittest.mock import MagicMock, patch
+
+from django.test import SimpleTestCase
+
+from ocpp.services.queue_consumer import ACK_INTERVAL, BatchedAckDeliveries
+
+
+@patch("ocpp.services.queue_consumer.close_old_connections")
+class BatchedAckDeliveriesTest(SimpleTestCase):
+    def test_acks_in_batches(self, close_old_connections):
+        channel = MagicMock()
+        fn = MagicMock(side_effect=[None, ValueError, None])
+        deliveries = BatchedAckDeliveries(MagicMock(), channel, fn, 2)
+        for tag in (1, 2, 3):
+            deliveries.on_message(channel, MagicMock(delivery_tag=tag), None, b"{}")
+        # a failed message is still acked, as part of its batch
+        channel.basic_ack.assert_called_once_with(delivery_tag=2, multiple=True)
+        deliveries.ack_pending()
+        channel.basic_ack.assert_called_with(delivery_tag=3, multiple=True)
+        assert fn.call_count == 3
+        # only the failed message has the database connection checked
+        close_old_connections.assert_called_once_with()
+
+    def test_acks_periodically(self, close_old_connections):
+        connection = MagicMock()
+        channel = MagicMock()
+        deliveries = BatchedAckDeliveries(connection, channel, MagicMock(), 10)
+        for tag in (1, 2, 3):
+            deliveries.on_message(channel, MagicMock(delivery_tag=tag), None, b"{}")
+        channel.basic_ack.assert_not_called()
+        deliveries.ack_periodically()
+        channel.basic_ack.assert_called_once_with(delivery_tag=3, multiple=True)
+        connection.call_later.assert_called_once_with(
+            ACK_INTERVAL, deliveries.ack_periodically
+        )
+        # nothing pending, nothing to ack
+        deliveries.ack_periodically()
+        channel.basic_ack.assert_called_once()
@@ -0,0 +1,31 @@
+from unittest.mock import patch
+
+from django.test import TestCase
+
+from ocpp.models import Message
+from ocpp.services.websocket_event_handler import WebsocketEventHandler
+from ocpp.tests.factory import ChargePointFactory
+
+
+@patch(
+    "ocpp.services.charge_point_service.ChargePointService.send_message_to_charge_point"
+)
+class ReceiveTest(TestCase):
+    def setUp(self) -> None:
+        self.charge_point = ChargePointFactory(ws_queue="ws1")
+
+    def test_receive_heartbeat(self, send_message_to_charge_point):
+        event = dict(
+            type="receive",
+            id=self.charge_point.id,
+            queue="ws1",
+            message=[2, "03.00003282c0eb8ce0r", "Heartbeat", {}],
+        )
+        # upsert and load the charge point, store the call, then in the handler's
+        # atomic block (a savepoint pair inside the test) update the charge point,
+        # save the reply and link it
+        with self.assertNumQueries(8):
+            WebsocketEventHandler.handle_websocket_event(event)
+        call = Message.objects.get(unique_id="03.00003282c0eb8ce0r", actor="cp")
+        reply = send_message_to_charge_point.mock_calls[0][1][1]
+        assert call.reply_id == reply.id
@@ -0,0 +1,37 @@
+from datetime import datetime, timezone
+from decimal import Decimal
+
+from django.core.serializers.json import DjangoJSONEncoder
+from django.test import SimpleTestCase
+
+from ocpp.types.charge_point_status import ChargePointStatus
+from ocpp.utils.serialization import (
+    json_decode,
+    json_encode,
+    json_encode_bytes,
+    json_normalize,
+)
+
+
+class JSONNormalizeTest(SimpleTestCase):
+    def test_matches_json_round_trip(self):
+        data = dict(
+            currentTime=datetime(2023, 3, 30, 1, 58, 48, 1234, tzinfo=timezone.utc),
+            status=ChargePointStatus.Preparing,
+            values=[1, 2.5, (Decimal("1.5"), None), {"nested": True}],
+        )
+        assert json_normalize(data) == json_decode(json_encode(data))
+
+
+class JSONEncodeTest(SimpleTestCase):
+    def test_bytes_match_str(self):
+        data = dict(status=ChargePointStatus.Available, at=datetime(2023, 3, 30))
+        assert json_encode_bytes(data) == json_encode(data).encode()
+
+    def test_utc_datetimes_match_django(self):
+        for value in (
+            datetime(2023, 3, 30, 1, 58, 48, tzinfo=timezone.utc),
+            datetime(2023, 3, 30, 1, 58, 48, 1234, tzinfo=timezone.utc),
+            datetime(2023, 3, 30, 1, 58, 48, 999999, tzinfo=timezone.utc),
+        ):
+            assert json_encode(value) == DjangoJSONEncoder().encode(value)
@@ -0,0 +1,23 @@
+from django.test import TestCase, override_settings
+
+from ocpp.services.ocpp.core.heartbeat import HeartbeatMiddleware
+from ocpp.types.action import Action
+from ocpp.types.message_type import MessageType
+from ocpp.utils.settings import load_ocpp_middleware
+
+
+class LoadOCPPMiddlewareTest(TestCase):
+    def test_no_setting(self):
+        assert load_ocpp_middleware() == {}
+
+    @override_settings(
+        OCPP_MIDDLEWARE={
+            ("Heartbeat", 2): ["ocpp.services.ocpp.core.heartbeat.HeartbeatMiddleware"]
+        }
+    )
+    def test_setting(self):
+        middleware = load_ocpp_middleware()
+        assert middleware == {
+            (Action.Heartbeat, MessageType.call): [HeartbeatMiddleware]
+        }
+        assert load_ocpp_middleware() is middleware
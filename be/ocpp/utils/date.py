@@ -2,7 +2,24 @@ from datetime import datetime, timezone
 
 
 def iso_format(dt: datetime):
-    return dt.isoformat().replace("+00:00", "Z")
+    formatted = dt.isoformat()
+    if formatted.endswith("+00:00"):
+        return formatted[:-6] + "Z"
+    return formatted
+
+
+def utc_iso_format(dt: datetime):
+    """Format a UTC datetime the way DjangoJSONEncoder does: milliseconds, Z suffix"""
+    fraction = ".%03d" % (dt.microsecond // 1000) if dt.microsecond else ""
+    return "%04d-%02d-%02dT%02d:%02d:%02d%sZ" % (
+        dt.year,
+        dt.month,
+        dt.day,
+        dt.hour,
+        dt.minute,
+        dt.second,
+        fraction,
+    )
 
 
 def utc_now():
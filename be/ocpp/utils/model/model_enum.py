@@ -2,12 +2,34 @@ from enum import Enum
 
 
 class ModelEnum(Enum):
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # members are already in place here (Python 3.11+)
+        cls._choices = tuple((i.value, i.value) for i in cls)
+
     @classmethod
     def choices(cls):
-        return [(i.value, i.value) for i in cls]
+        return cls._choices
 
     def __str__(self):
         return str(self.value)
 
     def __int__(self):
         return int(self.value)
+
+
+class MemberLookup(dict):
+    """Maps raw values, and the members themselves, to members of an enum
+
+    A plain dict lookup, cheaper than calling the enum class on hot paths.
+    """
+
+    def __init__(self, enum_class):
+        super().__init__({i.value: i for i in enum_class})
+        self.update({i: i for i in enum_class})
+        self.enum_class = enum_class
+
+    def __missing__(self, value):
+        raise ValueError(
+            "{!r} is not a valid {}".format(value, self.enum_class.__name__)
+        )
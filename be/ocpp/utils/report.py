@@ -0,0 +1,23 @@
+import csv
+import io
+import sys
+from contextlib import contextmanager
+
+STDOUT_BUFFER_SIZE = 1 << 20
+
+
+@contextmanager
+def stdout_csv_writer():
+    """A csv writer on stdout that flushes in large blocks instead of per row"""
+    sys.stdout.flush()
+    out = io.TextIOWrapper(
+        io.BufferedWriter(sys.stdout.buffer, buffer_size=STDOUT_BUFFER_SIZE),
+        encoding=sys.stdout.encoding,
+        newline="",
+    )
+    try:
+        yield csv.writer(out)
+    finally:
+        out.flush()
+        # hand stdout back untouched, closing the wrappers would close it too
+        out.detach().detach()
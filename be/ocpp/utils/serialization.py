@@ -1,22 +1,49 @@
 import dataclasses
-import json
+from datetime import datetime, timezone
 from enum import Enum
 
+import orjson
 from django.core.serializers.json import DjangoJSONEncoder
 
+from ocpp.utils.date import utc_iso_format
+
+# dates and times go through JSONEncoder to keep its millisecond, Z-suffixed format
+ORJSON_OPTIONS = orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_NON_STR_KEYS
+
+
+def json_encode_bytes(o):
+    return orjson.dumps(o, default=encoder.default, option=ORJSON_OPTIONS)
+
 
 def json_encode(o):
-    return json.dumps(o, cls=JSONEncoder)
+    return json_encode_bytes(o).decode()
 
 
 def json_decode(o):
-    return json.loads(o)
+    return orjson.loads(o)
+
+
+def json_normalize(o):
+    """What json_decode(json_encode(o)) gives, without going through a string"""
+    if o is None or isinstance(o, (str, int, float)):
+        return o
+    if isinstance(o, dict):
+        return {k: json_normalize(v) for k, v in o.items()}
+    if isinstance(o, (list, tuple)):
+        return [json_normalize(v) for v in o]
+    return json_normalize(encoder.default(o))
 
 
 class JSONEncoder(DjangoJSONEncoder):
     def default(self, obj):
+        # reply timestamps are UTC, format those without isoformat and slicing
+        if isinstance(obj, datetime) and obj.tzinfo is timezone.utc:
+            return utc_iso_format(obj)
         if isinstance(obj, Enum):
             return obj.value
         if dataclasses.is_dataclass(obj):
             return dataclasses.asdict(obj)
         return super().default(obj)
+
+
+encoder = JSONEncoder()
@@ -3,6 +3,8 @@ from typing import List
 
 from django.conf import settings
 from django.core.exceptions import ImproperlyConfigured
+from django.core.signals import setting_changed
+from django.dispatch import receiver
 from django.utils.module_loading import import_string
 
 from ocpp.types.action import Action
@@ -43,7 +45,6 @@ def _message_type(message_type_id):
         )
 
 
-@lru_cache
 def _load_ocpp_middleware_from_dict(setting: dict):
     return {
         (_action(k[0]), _message_type(k[1])): _import_classes(v)
@@ -51,9 +52,16 @@ def _load_ocpp_middleware_from_dict(setting: dict):
     }
 
 
+@lru_cache(maxsize=1)
 def load_ocpp_middleware():
     if not hasattr(settings, "OCPP_MIDDLEWARE"):
         return {}
     ocpp_middleware = settings.OCPP_MIDDLEWARE
     assert isinstance(ocpp_middleware, dict), "OCPP_MIDDLEWARE should be a dict"
     return _load_ocpp_middleware_from_dict(ocpp_middleware)
+
+
+@receiver(setting_changed)
+def reset_ocpp_middleware(setting, **kwargs):
+    if setting == "OCPP_MIDDLEWARE":
+        load_ocpp_middleware.cache_clear()
@@ -131,7 +131,8 @@ class ChargePointClient:
                         command_id = charge_point_command[1]
                         wait_for_reply = asyncio.Event()
                         self._awaiting_replies[command_id] = wait_for_reply
-                        await self.websocket.send_json(charge_point_command)
+                        # the body is already the JSON frame, forward it as-is
+                        await self.websocket.send_text(body)
                     except Exception:
                         logger.exception("ERR: CP %s", dict(cp=self._charge_point_id))
                         raise